@@ -1,13 +1,22 @@
+import asyncio
+import gzip
+import hashlib
+import math
 import os
+import threading
+from functools import lru_cache
+from itertools import repeat, starmap
 from pathlib import Path
 
-from typing import Annotated, Literal, TypeAlias
+from typing import Annotated, Final, Literal, TypeAlias
 
+import anyio
 import Fortuna
 import markdown
 from pydantic import Field
+from pydantic_core import to_json
 from mcp.server.fastmcp import FastMCP
-from starlette.responses import HTMLResponse, FileResponse
+from starlette.responses import HTMLResponse, Response
 from starlette.routing import Route
 
 
@@ -19,14 +28,40 @@ mcp = FastMCP(
     host="0.0.0.0",
 )
 
-Integer: TypeAlias = Annotated[int, Field(ge=Fortuna.min_int(), le=Fortuna.max_int())]
-PositiveInteger: TypeAlias = Annotated[int, Field(ge=1, le=Fortuna.max_int())]
+_MIN_INT: Final[int] = Fortuna.min_int()
+_MAX_INT: Final[int] = Fortuna.max_int()
+_MIN_FLOAT: Final[float] = Fortuna.min_float()
+_MAX_FLOAT: Final[float] = Fortuna.max_float()
+
+Integer: TypeAlias = Annotated[int, Field(ge=_MIN_INT, le=_MAX_INT)]
+PositiveInteger: TypeAlias = Annotated[int, Field(ge=1, le=_MAX_INT)]
 Polyhedron: TypeAlias = Literal[2, 4, 6, 8, 10, 12, 20, 30, 100]
 SampleSize: TypeAlias = Annotated[int, Field(ge=1, le=100)]
+SampleCount: TypeAlias = Annotated[int, Field(ge=1, le=10_000)]
 
-Float: TypeAlias = Annotated[float, Field(ge=Fortuna.min_float(), le=Fortuna.max_float())]
+Float: TypeAlias = Annotated[float, Field(ge=_MIN_FLOAT, le=_MAX_FLOAT)]
 CanonicalFloat: TypeAlias = Annotated[float, Field(ge=0, le=1)]
-PositiveFloat: TypeAlias = Annotated[float, Field(gt=0, le=Fortuna.max_float())]
+PositiveFloat: TypeAlias = Annotated[float, Field(gt=0, le=_MAX_FLOAT)]
+Weights: TypeAlias = Annotated[list[PositiveFloat], Field(min_length=1, max_length=1000)]
+
+_FORTUNA_INFO_TEXT = f"""
+### FortunaMCP v{version}: MCP Server
+FortunaMCP is a state-of-the-art random number generator (RNG) model context protocol (MCP) server.
+An RNG MCP built to bridge the gap where large language models (LLM) fall short in delivering true randomness.
+Powered by Fortuna, the FortunaMCP server provides high-quality random distributions for AI Agents performing simulations, modeling systems, and creative tasks.
+Built and maintained by Robert Sharp, proudly sponsored and hosted by Silicon Society, the FortunaMCP server exemplifies modern AI engineering and robust performance.
+
+### Fortuna v{Fortuna.version}: Python Library
+Fortuna is the powerhouse behind FortunaMCP. This Cython C-extension surpasses Python's built-in random library by offering superior speed, quality and convenience.
+Fortuna provides a robust library of RNG distribution algorithms and generator utilities.
+For technical details visit [Fortuna Documentation](https://github.com/BrokenShell/Fortuna/blob/master/README.md).
+
+### Storm v{Fortuna.storm_version()}: C++ Header Library
+Storm features Typhoon, the high-speed, thread-safe C++ RNG engine that fuels Fortuna.
+Engineered with hardware-based entropy and seeding, Typhoon guarantees that every random value generated is consistent, reliable, and free from unwanted bias, even in highly parallel environments.
+Storm is ideal for demanding scientific simulation and research tasks, delivering a robust suite of high-speed, high-quality distribution algorithms.
+For technical details visit [Storm Documentation](https://github.com/BrokenShell/Storm/blob/main/README.md).
+""".strip()
 
 
 @mcp.tool()
@@ -54,24 +89,7 @@ def fortuna_info() -> str:
     @tool_type: informational
     @return: A string containing detailed information about FortunaMCP, Fortuna, and Storm.
     """
-    return f"""
-### FortunaMCP v{version}: MCP Server
-FortunaMCP is a state-of-the-art random number generator (RNG) model context protocol (MCP) server.
-An RNG MCP built to bridge the gap where large language models (LLM) fall short in delivering true randomness.
-Powered by Fortuna, the FortunaMCP server provides high-quality random distributions for AI Agents performing simulations, modeling systems, and creative tasks.
-Built and maintained by Robert Sharp, proudly sponsored and hosted by Silicon Society, the FortunaMCP server exemplifies modern AI engineering and robust performance.
-
-### Fortuna v{Fortuna.version}: Python Library
-Fortuna is the powerhouse behind FortunaMCP. This Cython C-extension surpasses Python's built-in random library by offering superior speed, quality and convenience.
-Fortuna provides a robust library of RNG distribution algorithms and generator utilities.
-For technical details visit [Fortuna Documentation](https://github.com/BrokenShell/Fortuna/blob/master/README.md).
-
-### Storm v{Fortuna.storm_version()}: C++ Header Library
-Storm features Typhoon, the high-speed, thread-safe C++ RNG engine that fuels Fortuna.
-Engineered with hardware-based entropy and seeding, Typhoon guarantees that every random value generated is consistent, reliable, and free from unwanted bias, even in highly parallel environments.
-Storm is ideal for demanding scientific simulation and research tasks, delivering a robust suite of high-speed, high-quality distribution algorithms.
-For technical details visit [Storm Documentation](https://github.com/BrokenShell/Storm/blob/main/README.md).
-""".strip()
+    return _FORTUNA_INFO_TEXT
 
 
 @mcp.tool()
@@ -90,6 +108,50 @@ def dice(rolls: SampleSize, sides: Polyhedron) -> int:
     return Fortuna.dice(rolls, sides)
 
 
+@lru_cache(maxsize=128)
+def _alias_table(weights: tuple[float, ...]) -> tuple[tuple[float, ...], tuple[int, ...]]:
+    """Build a Walker alias table (Vose's method) for the given positive weights."""
+    size = len(weights)
+    peak = max(weights)
+    total = math.fsum(weight / peak for weight in weights)
+    scaled = [weight / peak * size / total for weight in weights]
+    probability = [1.0] * size
+    alias = list(range(size))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        less, more = small.pop(), large.pop()
+        probability[less] = scaled[less]
+        alias[less] = more
+        scaled[more] -= 1.0 - scaled[less]
+        (small if scaled[more] < 1.0 else large).append(more)
+    return tuple(probability), tuple(alias)
+
+
+@mcp.tool()
+def weighted_dice(weights: Weights, rolls: SampleSize) -> int:
+    """
+    Roll a specified number of loaded dice and return their summed total.
+
+    Each die has one face per entry in 'weights'; faces are numbered from 1 and face i lands with
+    probability weights[i-1] / sum(weights). Between 1 and 1000 weights may be given, each greater
+    than 0 and no more than 1.7976931348623157e+308. The number of dice must be between 1 and 100.
+
+    @param weights: Relative weight of each face, in face order (0 < weight <= 1.7976931348623157e+308).
+    @param rolls: Number of dice to roll (1 <= rolls <= 100).
+    @return: The total sum of the dice rolls.
+    """
+    probability, alias = _alias_table(tuple(weights))
+    size = len(probability)
+    total = 0
+    for _ in range(rolls):
+        face = Fortuna.random_below(size)
+        if Fortuna.canonical() >= probability[face]:
+            face = alias[face]
+        total += face + 1
+    return total
+
+
 @mcp.tool()
 def random_range(start: Integer, stop: Integer, step: Integer) -> int:
     """
@@ -105,6 +167,8 @@ def random_range(start: Integer, stop: Integer, step: Integer) -> int:
     @param step: Increment between values; must be non-zero (-9223372036854775807 <= step <= 9223372036854775807).
     @return: A random integer from the defined range.
     """
+    if step == 0:
+        raise ValueError("step must be non-zero")
     return Fortuna.random_range(start, stop, step)
 
 
@@ -247,7 +311,7 @@ def pareto_variate(alpha: PositiveFloat) -> float:
 @mcp.tool()
 def vonmises_variate(
     mu: Float,
-    kappa: Annotated[float, Field(ge=0, le=Fortuna.max_float())],
+    kappa: Annotated[float, Field(ge=0, le=_MAX_FLOAT)],
 ) -> float:
     """
     Produce a random angle based on the Von Mises distribution.
@@ -418,13 +482,176 @@ def student_t_variate(degrees_of_freedom: PositiveFloat) -> float:
     return Fortuna.student_t_variate(degrees_of_freedom)
 
 
-async def root(request):
-    """Serve the README as HTML at the root path"""
-    readme = Path("README.md").read_text()
-    html_content = markdown.markdown(readme, extensions=['tables', 'fenced_code'])
-    #  🎲
-    html_response = f"""
-    <!DOCTYPE html>
+_OFFLOAD_THRESHOLD: Final[int] = 250
+
+
+def _draw(variate, count, args, cast) -> str:
+    """
+    Draw 'count' values and serialize them as one JSON array so they are returned as a single text result.
+
+    Values are drawn in chunks of _OFFLOAD_THRESHOLD: starmap over a C function never yields the GIL,
+    so returning to the interpreter between chunks is what lets the event loop run during a large batch.
+    """
+    values = []
+    for offset in range(0, count, _OFFLOAD_THRESHOLD):
+        chunk = starmap(variate, repeat(args, min(_OFFLOAD_THRESHOLD, count - offset)))
+        values.extend(chunk if cast is None else map(cast, chunk))
+    return to_json(values).decode()
+
+
+async def _sample(variate, count, *args, cast=None) -> str:
+    """
+    Draw 'count' values from a Fortuna distribution in a single tool call, as a JSON array.
+
+    Batches of _OFFLOAD_THRESHOLD or more are drawn and serialized in a worker thread, so a large
+    request holds the event loop for at most one chunk at a time rather than the whole batch.
+    """
+    if count < _OFFLOAD_THRESHOLD:
+        return _draw(variate, count, args, cast)
+    return await anyio.to_thread.run_sync(_draw, variate, count, args, cast)
+
+
+@mcp.tool(structured_output=False)
+async def dice_batch(rolls: SampleSize, sides: Polyhedron, count: SampleCount) -> str:
+    """
+    Roll the same set of dice repeatedly and return the summed total of each roll.
+
+    Equivalent to calling the dice tool 'count' times, in a single request.
+    The number of dice must be between 1 and 100, 'sides' must be one of the standard
+    values: 2, 4, 6, 8, 10, 12, 20, 30, or 100, and 'count' must be between 1 and 10000.
+
+    @param rolls: Number of dice to roll (1 <= rolls <= 100).
+    @param sides: Number of sides per die; allowed values are 2, 4, 6, 8, 10, 12, 20, 30, or 100.
+    @param count: Number of totals to generate (1 <= count <= 10000).
+    @return: A JSON array of 'count' dice totals.
+    """
+    return await _sample(Fortuna.dice, count, rolls, sides)
+
+
+@mcp.tool(structured_output=False)
+async def random_range_batch(start: Integer, stop: Integer, step: Integer, count: SampleCount) -> str:
+    """
+    Return many random integers selected from a sequence defined by a range.
+
+    Equivalent to calling the random_range tool 'count' times, in a single request.
+    The parameters 'start', 'stop', and 'step' must be within the integer bounds of
+    -9223372036854775807 to 9223372036854775807, 'step' must be non-zero,
+    and 'count' must be between 1 and 10000.
+
+    @param start: Starting value of the range (inclusive; -9223372036854775807 <= start <= 9223372036854775807).
+    @param stop: Ending value of the range (exclusive; -9223372036854775807 <= stop <= 9223372036854775807).
+    @param step: Increment between values; must be non-zero (-9223372036854775807 <= step <= 9223372036854775807).
+    @param count: Number of values to generate (1 <= count <= 10000).
+    @return: A JSON array of 'count' random integers from the defined range.
+    """
+    if step == 0:
+        raise ValueError("step must be non-zero")
+    return await _sample(Fortuna.random_range, count, start, stop, step)
+
+
+@mcp.tool(structured_output=False)
+async def random_float_batch(lower_limit: Float, upper_bound: Float, count: SampleCount) -> str:
+    """
+    Produce many random floats uniformly distributed within a specified interval.
+
+    Equivalent to calling the random_float tool 'count' times, in a single request.
+    Both 'lower_limit' and 'upper_bound' must lie within the float bounds of
+    -1.7976931348623157e+308 to 1.7976931348623157e+308, lower_limit must be strictly less than upper_bound,
+    and 'count' must be between 1 and 10000.
+
+    @param lower_limit: Inclusive lower bound (-1.7976931348623157e+308 <= lower_limit < upper_bound).
+    @param upper_bound: Exclusive upper bound (lower_limit < upper_bound <= 1.7976931348623157e+308).
+    @param count: Number of values to generate (1 <= count <= 10000).
+    @return: A JSON array of 'count' random floats from the specified interval.
+    """
+    return await _sample(Fortuna.random_float, count, lower_limit, upper_bound)
+
+
+@mcp.tool(structured_output=False)
+async def triangular_batch(lower_limit: Float, upper_limit: Float, mode: Float, count: SampleCount) -> str:
+    """
+    Generate many random floats from a triangular distribution.
+
+    Equivalent to calling the triangular tool 'count' times, in a single request.
+    All parameters must lie within the float bounds of -1.7976931348623157e+308 to 1.7976931348623157e+308,
+    must satisfy lower_limit <= mode <= upper_limit, and 'count' must be between 1 and 10000.
+
+    @param lower_limit: Minimum possible value (-1.7976931348623157e+308 <= lower_limit).
+    @param upper_limit: Maximum possible value (upper_limit <= 1.7976931348623157e+308).
+    @param mode: Most likely value; must satisfy lower_limit <= mode <= upper_limit.
+    @param count: Number of values to generate (1 <= count <= 10000).
+    @return: A JSON array of 'count' random floats sampled from the triangular distribution.
+    """
+    return await _sample(Fortuna.triangular, count, lower_limit, upper_limit, mode)
+
+
+@mcp.tool(structured_output=False)
+async def bernoulli_variate_batch(ratio_of_truth: CanonicalFloat, count: SampleCount) -> str:
+    """
+    Perform many independent Bernoulli trials returning their boolean outcomes.
+
+    Equivalent to calling the bernoulli_variate tool 'count' times, in a single request.
+    The chance of success is given by 'ratio_of_truth', which must be between 0 and 1 (inclusive),
+    and 'count' must be between 1 and 10000.
+
+    @param ratio_of_truth: Success probability (0 <= ratio_of_truth <= 1).
+    @param count: Number of trials to perform (1 <= count <= 10000).
+    @return: A JSON array of 'count' outcomes, each True with probability equal to ratio_of_truth.
+    """
+    return await _sample(Fortuna.bernoulli_variate, count, ratio_of_truth, cast=bool)
+
+
+@mcp.tool(structured_output=False)
+async def poisson_variate_batch(mean: PositiveFloat, count: SampleCount) -> str:
+    """
+    Generate many random integers from a Poisson distribution.
+
+    Equivalent to calling the poisson_variate tool 'count' times, in a single request.
+    'mean' must be greater than 0 and no more than 1.7976931348623157e+308,
+    and 'count' must be between 1 and 10000.
+
+    @param mean: Expected occurrences (λ > 0 and ≤ 1.7976931348623157e+308).
+    @param count: Number of values to generate (1 <= count <= 10000).
+    @return: A JSON array of 'count' random integers from the Poisson distribution.
+    """
+    return await _sample(Fortuna.poisson_variate, count, mean)
+
+
+@mcp.tool(structured_output=False)
+async def exponential_variate_batch(lambda_rate: PositiveFloat, count: SampleCount) -> str:
+    """
+    Generate many random floats from an exponential distribution.
+
+    Equivalent to calling the exponential_variate tool 'count' times, in a single request.
+    'lambda_rate' must be greater than 0 and no more than 1.7976931348623157e+308,
+    and 'count' must be between 1 and 10000.
+
+    @param lambda_rate: Rate parameter (λ > 0 and ≤ 1.7976931348623157e+308).
+    @param count: Number of values to generate (1 <= count <= 10000).
+    @return: A JSON array of 'count' floats representing times until the next event.
+    """
+    return await _sample(Fortuna.exponential_variate, count, lambda_rate)
+
+
+@mcp.tool(structured_output=False)
+async def normal_variate_batch(mean: Float, std_dev: PositiveFloat, count: SampleCount) -> str:
+    """
+    Generate many random floats from a normal (Gaussian) distribution.
+
+    Equivalent to calling the normal_variate tool 'count' times, in a single request.
+    'mean' must lie within -1.7976931348623157e+308 to 1.7976931348623157e+308,
+    'std_dev' must be greater than 0 and no more than 1.7976931348623157e+308,
+    and 'count' must be between 1 and 10000.
+
+    @param mean: Mean value (μ) within [-1.7976931348623157e+308, 1.7976931348623157e+308].
+    @param std_dev: Standard deviation (σ > 0 and ≤ 1.7976931348623157e+308).
+    @param count: Number of values to generate (1 <= count <= 10000).
+    @return: A JSON array of 'count' random floats from the normal distribution.
+    """
+    return await _sample(Fortuna.normal_variate, count, mean, std_dev)
+
+
+_HTML_PREFIX = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -478,32 +705,101 @@ async def root(request):
 <body>
     <main>
         <span class="version">v{version}</span>
-        {html_content}
+        """
+_HTML_SUFFIX = """
     </main>
 </body>
 </html>
-""".strip()
-    return HTMLResponse(content=html_response)
+"""
+
+
+_PROJECT_ROOT: Final = Path(__file__).resolve().parent.parent
+_README_PATH: Final = _PROJECT_ROOT / "README.md"
+_FAVICON_PATH: Final = _PROJECT_ROOT / "static" / "favicon.ico"
+_MARKDOWN = markdown.Markdown(extensions=['tables', 'fenced_code'])
+_markdown_lock = threading.Lock()
+
+
+def _render_readme(mtime: int) -> tuple[bytes, bytes]:
+    """Render the README as a complete HTML page, plain and gzipped, and cache it under the given mtime"""
+    readme = _README_PATH.read_text()
+    with _markdown_lock:
+        html_content = _MARKDOWN.reset().convert(readme)
+    html_bytes = (_HTML_PREFIX + html_content + _HTML_SUFFIX).encode("utf-8")
+    rendered = html_bytes, gzip.compress(html_bytes, 9)
+    _readme_cache.clear()
+    _readme_cache[mtime] = rendered
+    return rendered
+
+
+_readme_cache: dict[int, tuple[bytes, bytes]] = {}
+_render_readme(os.stat(_README_PATH).st_mtime_ns)
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip, honoring q-values and the '*' wildcard"""
+    qualities = {}
+    for coding in accept_encoding.split(","):
+        name, *params = coding.split(";")
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name.strip().lower()] = quality
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+
+async def root(request):
+    """Serve the README as HTML at the root path, re-rendering only when the file changes"""
+    mtime = os.stat(_README_PATH).st_mtime_ns
+    rendered = _readme_cache.get(mtime)
+    if rendered is None:
+        rendered = await anyio.to_thread.run_sync(_render_readme, mtime)
+    html_bytes, gzip_bytes = rendered
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        return HTMLResponse(
+            content=gzip_bytes,
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+    return HTMLResponse(content=html_bytes, headers={"Vary": "Accept-Encoding"})
+
+
+_FAVICON_BYTES = _FAVICON_PATH.read_bytes()
+_FAVICON_ETAG = f'"{hashlib.blake2b(_FAVICON_BYTES, digest_size=8).hexdigest()}"'
+_FAVICON_HEADERS = {"Cache-Control": "public, max-age=86400, immutable", "ETag": _FAVICON_ETAG}
+_FAVICON_RESPONSE = Response(_FAVICON_BYTES, media_type="image/vnd.microsoft.icon", headers=_FAVICON_HEADERS)
+_FAVICON_NOT_MODIFIED = Response(status_code=304, headers=_FAVICON_HEADERS)
 
 
 async def favicon(request):
-    favicon_path = Path("static/favicon.ico")
-    return FileResponse(str(favicon_path))
+    """Serve the favicon from memory, answering conditional requests with 304"""
+    if _FAVICON_ETAG in request.headers.get("if-none-match", ""):
+        return _FAVICON_NOT_MODIFIED
+    return _FAVICON_RESPONSE
 
 
 if __name__ == "__main__":
     print(f"Starting Fortuna MCP Server {version}")
-    _sse_app = mcp.sse_app
+    app = mcp.sse_app()
+    app.router.routes.insert(0, Route("/", root, methods=["GET"]))
+    app.router.routes.insert(1, Route("/favicon.ico", favicon, methods=["GET"]))
 
 
-    def sse_app(request):
-        app = _sse_app()
-        root_route = Route("/", root, methods=["GET"])
-        favicon_route = Route("/favicon.ico", favicon, methods=["GET"])
-        app.router.routes.insert(0, root_route)
-        app.router.routes.insert(1, favicon_route)
+    def sse_app(mount_path=None):
         return app
 
 
     mcp.sse_app = sse_app
+
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     mcp.run(transport="sse")
@@ -11,6 +11,13 @@ class FortunaAgent:
     # mcp_url = "https://fortuna-mcp.siliconsociety.org/sse"
     mcp_url = "http://localhost/sse"
     model = "gpt-4.1-nano"
+    instructions = (
+        "You specialize in random value generation. "
+        "When randomness is needed, use the tools provided by FortunaMCP. "
+        "When many values are needed, use the batch tools provided by FortunaMCP. "
+        "When information about FortunaMCP, Fortuna, Storm, Robert Sharp or "
+        "Silicon Society is requested use the fortuna_info tool provided by FortunaMCP. "
+    )
 
     def __init__(self):
         self.mcp_server = MCPServerSse(
@@ -23,12 +30,7 @@ class FortunaAgent:
         await self.mcp_server.__aenter__()
         self.agent = Agent(
             name="FortunaAgent",
-            instructions=(
-                "You specialize in random value generation. "
-                "When randomness is needed, use the tools provided by FortunaMCP. "
-                "When information about FortunaMCP, Fortuna, Storm, Robert Sharp or "
-                "Silicon Society is requested use the fortuna_info tool provided by FortunaMCP. "
-            ),
+            instructions=self.instructions,
             mcp_servers=[self.mcp_server],
             model=self.model,
             model_settings=ModelSettings(tool_choice="auto"),
@@ -47,7 +49,10 @@ async def main():
     await bot.initialize()
     try:
         while True:
-            user_input = await asyncio.to_thread(input, "\n>>> ")
+            try:
+                user_input = await asyncio.to_thread(input, "\n>>> ")
+            except EOFError:
+                break
             if user_input.lower() in ("", "q", "quit", "exit"):
                 break
             bot_reply = await bot.run(request=user_input)